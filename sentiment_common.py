@@ -0,0 +1,98 @@
+"""
+Shared VADER sentiment helpers for the bias-analysis scripts.
+
+Every script imports its analyzer from here, so running several of them in one
+process (a notebook, CI) loads the VADER lexicon only once.
+
+Required:
+    pip install nltk numpy
+    pip install numba  # optional, speeds up the FAST_VADER approximation
+"""
+
+from functools import lru_cache
+import math
+import re
+
+import nltk
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+import numpy as np
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def ensure_vader_lexicon():
+    # Only hit the NLTK downloader if the lexicon isn't installed locally
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon', quiet=True)
+
+@lru_cache(maxsize=1)
+def get_sia():
+    ensure_vader_lexicon()
+    return SentimentIntensityAnalyzer()
+
+# Optional fast path: sum raw lexicon valences per text (inside a Numba kernel
+# when numba is installed, with hoisted lookups otherwise) and apply VADER's
+# normalization. This skips VADER's negation, intensifier and punctuation
+# rules, so it only approximates polarity_scores().
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+@lru_cache(maxsize=1)
+def get_lexicon_arrays():
+    lexicon = get_sia().lexicon
+    index = {token: i for i, token in enumerate(lexicon)}
+    vals = np.array(list(lexicon.values()), dtype=np.float32)
+    return index, vals
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _score_all(tokens, offsets, vals):
+        out = np.empty(len(offsets) - 1)
+        for i in numba.prange(len(offsets) - 1):
+            s = 0.0
+            for j in range(offsets[i], offsets[i + 1]):
+                s += vals[tokens[j]]
+            out[i] = s / np.sqrt(s * s + 15)
+        return out
+
+def fast_compound_all(texts):
+    """
+    Approximate VADER compound scores for a sequence of texts.
+    Tokens are packed into one flat int32 array with per-text offsets.
+    """
+    index, vals = get_lexicon_arrays()
+    tokens = []
+    offsets = [0]
+    for text in texts:
+        tokens.extend(index[t] for t in _TOKEN_RE.findall(text.lower()) if t in index)
+        offsets.append(len(tokens))
+    return _score_all(np.array(tokens, dtype=np.int32),
+                      np.array(offsets, dtype=np.int64), vals)
+
+def fast_compound(text, lex_get, tok=_TOKEN_RE.findall, sqrt=math.sqrt):
+    """
+    Pure-Python version of the fast path for a single text.
+    lex_get should be a pre-bound lexicon.get.
+    """
+    s = 0.0
+    for t in tok(text.lower()):
+        s += lex_get(t, 0.0)
+    return s / sqrt(s * s + 15)
+
+def compound_scores(texts, fast=False):
+    """
+    Return the VADER compound score for each text in a list.
+    With fast=True, use the approximate lexicon-sum scorer instead.
+    """
+    if fast and _NUMBA_AVAILABLE:
+        return fast_compound_all(texts)
+    if fast:
+        lex_get = get_sia().lexicon.get
+        return [fast_compound(txt, lex_get) for txt in texts]
+    score = get_sia().polarity_scores
+    return [score(txt)['compound'] for txt in texts]